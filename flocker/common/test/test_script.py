@@ -9,6 +9,7 @@ from eliot import Message
 
 from twisted.internet import task
 from twisted.internet.defer import succeed
+from twisted.internet.error import ReactorNotRunning
 from twisted.python import usage
 from twisted.python.failure import Failure
 from twisted.python.log import LogPublisher
@@ -29,15 +30,15 @@ from ...testtools import (
 class FlockerScriptRunnerInitTests(TestCase):
     """Tests for :py:meth:`FlockerScriptRunner.__init__`."""
 
+    def setUp(self):
+        super(FlockerScriptRunnerInitTests, self).setUp()
+        self.default_runner = FlockerScriptRunner(script=None, options=None)
+
     def test_sys_default(self):
         """
         `FlockerScriptRunner.sys` is `sys` by default.
         """
-        self.assertIs(
-            sys,
-            FlockerScriptRunner(
-                script=None, options=None).sys_module
-        )
+        self.assertIs(sys, self.default_runner.sys_module)
 
     def test_sys_override(self):
         """
@@ -54,10 +55,33 @@ class FlockerScriptRunnerInitTests(TestCase):
         """
         `FlockerScriptRunner._react` is ``task.react`` by default
         """
-        self.assertIs(
-            task.react,
-            FlockerScriptRunner(script=None, options=None)._react
-        )
+        self.assertIs(task.react, self.default_runner._react)
+
+
+class OptionsSpy(usage.Options):
+    """
+    A ``usage.Options`` which records the arguments passed to
+    ``parseOptions``.
+    """
+    def parseOptions(self, arguments):
+        self.parseOptionsArguments = arguments
+
+
+class FakeOptions(usage.Options):
+    """
+    A ``usage.Options`` whose ``parseOptions`` always raises ``UsageError``.
+    """
+    synopsis = 'Usage: test_command [options]'
+
+    def __init__(self, message):
+        """
+        :param bytes message: The message of the ``UsageError`` to raise.
+        """
+        usage.Options.__init__(self)
+        self.message = message
+
+    def parseOptions(self, arguments):
+        raise usage.UsageError(self.message)
 
 
 class FlockerScriptRunnerParseOptionsTests(TestCase):
@@ -69,10 +93,6 @@ class FlockerScriptRunnerParseOptionsTests(TestCase):
         passes them to the `parseOptions` method of its ``options`` attribute
         and returns the populated options instance.
         """
-        class OptionsSpy(usage.Options):
-            def parseOptions(self, arguments):
-                self.parseOptionsArguments = arguments
-
         expectedArguments = [object(), object()]
         runner = FlockerScriptRunner(script=None, options=OptionsSpy())
         options = runner._parse_options(expectedArguments)
@@ -85,40 +105,82 @@ class FlockerScriptRunnerParseOptionsTests(TestCase):
         before exiting with status 1.
         """
         expectedMessage = b'foo bar baz'
-        expectedCommandName = b'test_command'
-
-        class FakeOptions(usage.Options):
-            synopsis = 'Usage: %s [options]' % (expectedCommandName,)
-
-            def parseOptions(self, arguments):
-                raise usage.UsageError(expectedMessage)
-
         fake_sys = FakeSysModule()
 
-        runner = FlockerScriptRunner(script=None, options=FakeOptions(),
+        runner = FlockerScriptRunner(script=None,
+                                     options=FakeOptions(expectedMessage),
                                      sys_module=fake_sys)
         error = self.assertRaises(SystemExit, runner._parse_options, [])
-        expectedErrorMessage = b'ERROR: %s\n' % (expectedMessage,)
+        expectedErrorMessage = b'ERROR: ' + expectedMessage + b'\n'
         errorText = fake_sys.stderr.getvalue()
-        self.assertEqual(
-            (1, [], expectedErrorMessage),
-            (error.code,
-             help_problems(u'test_command', errorText),
-             errorText[-len(expectedErrorMessage):])
+        self.assertEqual(1, error.code)
+        self.assertTrue(
+            errorText.endswith(expectedErrorMessage),
+            "%r does not end with %r" % (errorText, expectedErrorMessage)
         )
+        self.assertEqual([], help_problems(u'test_command', errorText))
+
+
+class RunnableClock(task.Clock):
+    """
+    A ``task.Clock`` with just enough of ``IReactorCore`` to be driven by
+    ``task.react``.
+
+    :ivar bool running: Whether ``run`` has been called and ``stop`` has not.
+    """
+    def __init__(self):
+        task.Clock.__init__(self)
+        self.running = False
+        self._when_running = []
+        self._shutdown_triggers = []
+
+    def callWhenRunning(self, f, *args, **kwargs):
+        if self.running:
+            f(*args, **kwargs)
+        else:
+            self._when_running.append((f, args, kwargs))
+
+    def addSystemEventTrigger(self, phase, event_type, f, *args, **kwargs):
+        """
+        Record a trigger for the ``shutdown`` event.  Triggers are all run by
+        ``stop``, in the order they were added, regardless of ``phase``.
+        """
+        if event_type == "shutdown":
+            self._shutdown_triggers.append((f, args, kwargs))
+
+    def run(self):
+        self.running = True
+        when_running, self._when_running = self._when_running, []
+        for f, args, kwargs in when_running:
+            f(*args, **kwargs)
+
+    def stop(self):
+        if not self.running:
+            raise ReactorNotRunning()
+        self.running = False
+        for f, args, kwargs in self._shutdown_triggers:
+            f(*args, **kwargs)
+
+
+class SpyOptions(usage.Options):
+    """
+    A ``usage.Options`` with a ``--hello`` option which records its value.
+    """
+    def opt_hello(self, value):
+        self.value = value
 
 
 class FlockerScriptRunnerMainTests(TestCase):
     """Tests for :py:meth:`FlockerScriptRunner.main`."""
 
+    def setUp(self):
+        super(FlockerScriptRunnerMainTests, self).setUp()
+        self.fake_reactor = RunnableClock()
+
     def test_main_uses_sysargv(self):
         """
         ``FlockerScriptRunner.main`` uses ``self.sys_module.argv``.
         """
-        class SpyOptions(usage.Options):
-            def opt_hello(self, value):
-                self.value = value
-
         class SpyScript(object):
             def main(self, reactor, arguments):
                 self.reactor = reactor
@@ -128,13 +190,8 @@ class FlockerScriptRunnerMainTests(TestCase):
         options = SpyOptions()
         script = SpyScript()
         sys = FakeSysModule(argv=[b"flocker", b"--hello", b"world"])
-        # XXX: We shouldn't be using this private fake and Twisted probably
-        # shouldn't either. See https://twistedmatrix.com/trac/ticket/6200 and
-        # https://twistedmatrix.com/trac/ticket/7527
-        from twisted.test.test_task import _FakeReactor
-        fakeReactor = _FakeReactor()
         runner = FlockerScriptRunner(script, options,
-                                     reactor=fakeReactor, sys_module=sys,
+                                     reactor=self.fake_reactor, sys_module=sys,
                                      logging=False)
         self.assertRaises(SystemExit, runner.main)
         self.assertEqual(b"world", script.arguments.value)
@@ -151,16 +208,11 @@ class FlockerScriptRunnerMainTests(TestCase):
 
         script = Script()
         sys = FakeSysModule(argv=[])
-        # XXX: We shouldn't be using this private fake and Twisted probably
-        # shouldn't either. See https://twistedmatrix.com/trac/ticket/6200 and
-        # https://twistedmatrix.com/trac/ticket/7527
-        from twisted.test.test_task import _FakeReactor
-        fakeReactor = _FakeReactor()
         runner = FlockerScriptRunner(script, usage.Options(),
-                                     reactor=fakeReactor, sys_module=sys,
+                                     reactor=self.fake_reactor, sys_module=sys,
                                      logging=False)
         self.assertRaises(SystemExit, runner.main)
-        self.assertEqual(sys.stdout.getvalue(), b"")
+        self.assertEqual(0, sys.stdout.tell())
 
 
 @flocker_standard_options
@@ -269,17 +321,20 @@ class EliotObserverTests(TestCase):
     """
     Tests for ``EliotObserver``.
     """
+    def setUp(self):
+        super(EliotObserverTests, self).setUp()
+        self.publisher = LogPublisher()
+        self.observer = EliotObserver(self.publisher)
+        self.publisher.addObserver(self.observer)
+
     @validateLogging(None)
     def test_message(self, logger):
         """
         A message logged to the given ``LogPublisher`` is converted to an
         Eliot log message.
         """
-        publisher = LogPublisher()
-        observer = EliotObserver(publisher)
-        observer.logger = logger
-        publisher.addObserver(observer)
-        publisher.msg(b"Hello", b"world")
+        self.observer.logger = logger
+        self.publisher.msg(b"Hello", b"world")
         assertHasMessage(self, logger, TWISTED_LOG_MESSAGE,
                          dict(error=False, message=u"Hello world"))
 
@@ -289,14 +344,11 @@ class EliotObserverTests(TestCase):
         An error logged to the given ``LogPublisher`` is converted to an Eliot
         log message.
         """
-        publisher = LogPublisher()
-        observer = EliotObserver(publisher)
-        observer.logger = logger
-        publisher.addObserver(observer)
+        self.observer.logger = logger
         # No public API for this unfortunately, so emulate error logging:
-        publisher.msg(failure=Failure(ZeroDivisionError("onoes")),
-                      why=b"A zero division ono",
-                      isError=True)
+        self.publisher.msg(failure=Failure(ZeroDivisionError("onoes")),
+                           why=b"A zero division ono",
+                           isError=True)
         message = (u'A zero division ono\nTraceback (most recent call '
                    u'last):\nFailure: exceptions.ZeroDivisionError: onoes\n')
         assertHasMessage(self, logger, TWISTED_LOG_MESSAGE,
@@ -378,10 +378,8 @@ def make_standard_options_test(options):
                 options(sys_module=sys).parseOptions,
                 ['--version']
             )
-            self.assertEqual(
-                (__version__ + '\n', 0),
-                (sys.stdout.getvalue(), error.code)
-            )
+            self.assertEqual(__version__ + '\n', sys.stdout.getvalue())
+            self.assertEqual(0, error.code)
 
         def test_verbosity_default(self):
             """